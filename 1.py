@@ -1,9 +1,55 @@
+import atexit
+import contextlib
+import io
 import json
 import os
+import sys
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-@dataclass
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    # Без fastmath: ядро состоит из одних сравнений, а поиск передаёт
+    # np.inf как «цена не ограничена» — fastmath вправе считать, что
+    # бесконечностей не бывает
+    @njit(cache=True)
+    def _mask_computers(ram, price, ssd, min_ram, max_price, min_ssd):
+        """Маска по числовым условиям одним слитным циклом (JIT-компиляция)"""
+        n = ram.shape[0]
+        mask = np.empty(n, np.bool_)
+        for i in range(n):
+            mask[i] = ram[i] >= min_ram and price[i] <= max_price and ssd[i] >= min_ssd
+        return mask
+
+    # Прогрев компиляции при импорте, чтобы первый поиск не ждал JIT
+    _mask_computers(np.empty(0, np.int32), np.empty(0, np.float64),
+                    np.empty(0, np.int32), 0, np.inf, 0)
+else:
+    def _mask_computers(ram, price, ssd, min_ram, max_price, min_ssd):
+        """Маска по числовым условиям (запасной вариант без numba)"""
+        return (ram >= min_ram) & (price <= max_price) & (ssd >= min_ssd)
+
+
+# Готовый шаблон строкового представления: собирается один раз на модуль,
+# __str__ лишь подставляет значения вместо пересборки f-строки по кускам
+_COMPUTER_FMT = ("[ID: {id}] {model}{sale}\n"
+                 "  Процессор: {proc}, ОЗУ: {ram} ГБ, SSD: {ssd} ГБ\n"
+                 "  Видеокарта: {gfx}, Цена: {price:,.2f} руб.\n")
+
+
+@dataclass(slots=True)
 class GamingComputer:
     id: int
     model: str
@@ -16,10 +62,11 @@ class GamingComputer:
     
     def __str__(self):
         """Строковое представление компьютера"""
-        sale_status = " (РАСПРОДАЖА -10%)" if self.is_on_sale else ""
-        return (f"[ID: {self.id}] {self.model}{sale_status}\n"
-                f"  Процессор: {self.processor}, ОЗУ: {self.ram} ГБ, SSD: {self.ssd} ГБ\n"
-                f"  Видеокарта: {self.graphics_card}, Цена: {self.price:,.2f} руб.\n")
+        return _COMPUTER_FMT.format(
+            id=self.id, model=self.model,
+            sale=" (РАСПРОДАЖА -10%)" if self.is_on_sale else "",
+            proc=self.processor, ram=self.ram, ssd=self.ssd,
+            gfx=self.graphics_card, price=self.price)
     
     def to_dict(self):
         """Преобразование в словарь для сохранения в JSON"""
@@ -50,35 +97,153 @@ class GamingComputer:
 
 
 class ComputerManager:
-    """Класс для управления коллекцией компьютеров"""
-    
+    """Класс для управления коллекцией компьютеров
+
+    Данные хранятся по колонкам (SoA): числовые поля — в массивах NumPy,
+    строковые — в массивах dtype=object. Флаг is_on_sale лежит в массиве
+    np.bool_ (1 байт на строку вместо Python-объекта bool). Объекты
+    GamingComputer собираются из колонок только при выводе, поэтому
+    поиск/сортировка/агрегаты идут по плотным массивам без обхода
+    Python-объектов.
+    """
+
     def __init__(self, filename='computers.json'):
         self.filename = filename
-        self.computers: List[GamingComputer] = []
+        self._ids = np.empty(0, np.int32)
+        self._ram = np.empty(0, np.int32)
+        self._ssd = np.empty(0, np.int32)
+        self._price = np.empty(0, np.float64)
+        self._is_on_sale = np.empty(0, np.bool_)
+        self._models = np.empty(0, object)
+        self._processors = np.empty(0, object)
+        self._graphics = np.empty(0, object)
+        self._graphics_lower: List[str] = []
+        self._id_index: dict = {}
+        self._price_order = None
+        self._price_sorted = None
+        self._dirty = False
         self.load_data()
-    
-    def load_data(self):
+        atexit.register(self.flush)
+
+    @property
+    def computers(self) -> List[GamingComputer]:
+        """Материализация объектов из колонок (используется только для вывода)"""
+        return [self._row(i) for i in range(self._ids.size)]
+
+    def _row(self, i: int) -> GamingComputer:
+        """Сборка объекта GamingComputer из i-й строки колонок"""
+        return GamingComputer(
+            id=int(self._ids[i]),
+            model=self._models[i],
+            processor=self._processors[i],
+            ram=int(self._ram[i]),
+            ssd=int(self._ssd[i]),
+            graphics_card=self._graphics[i],
+            price=float(self._price[i]),
+            is_on_sale=bool(self._is_on_sale[i])
+        )
+
+    def _fill_columns(self, data: List[dict]) -> None:
+        """Массовое заполнение колонок: np.fromiter с известным count
+        пишет сразу в итоговый массив без промежуточных списков"""
+        n = len(data)
+        self._ids = np.fromiter((item['id'] for item in data), np.int32, n)
+        self._ram = np.fromiter((item['ram'] for item in data), np.int32, n)
+        self._ssd = np.fromiter((item['ssd'] for item in data), np.int32, n)
+        self._price = np.fromiter((item['price'] for item in data), np.float64, n)
+        self._is_on_sale = np.fromiter((item.get('is_on_sale', False) for item in data),
+                                       np.bool_, n)
+        self._models = np.array([item['model'] for item in data], object)
+        self._processors = np.array([item['processor'] for item in data], object)
+        self._graphics = np.array([item['graphics_card'] for item in data], object)
+        self._graphics_lower = [g.lower() for g in self._graphics]
+        self._price_order = None
+        self._rebuild_id_index()
+
+    def _rebuild_id_index(self) -> None:
+        """Перестроение индекса ID -> номер строки"""
+        self._id_index = {int(cid): i for i, cid in enumerate(self._ids)}
+
+    def _price_index(self):
+        """Ленивая отсортированная перестановка по цене для бинарного поиска"""
+        if self._price_order is None:
+            self._price_order = np.argsort(self._price, kind='stable')
+            self._price_sorted = self._price[self._price_order]
+        return self._price_order, self._price_sorted
+
+    def _delete_rows(self, indices) -> None:
+        """Удаление строк из всех колонок"""
+        self._ids = np.delete(self._ids, indices)
+        self._ram = np.delete(self._ram, indices)
+        self._ssd = np.delete(self._ssd, indices)
+        self._price = np.delete(self._price, indices)
+        self._is_on_sale = np.delete(self._is_on_sale, indices)
+        self._models = np.delete(self._models, indices)
+        self._processors = np.delete(self._processors, indices)
+        self._graphics = np.delete(self._graphics, indices)
+        self._graphics_lower = [g.lower() for g in self._graphics]
+        self._price_order = None
+        self._rebuild_id_index()
+
+    def load_data(self) -> None:
         """Загрузка данных из файла"""
         if os.path.exists(self.filename):
             try:
-                with open(self.filename, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.computers = [GamingComputer.from_dict(item) for item in data]
-                print(f"Загружено {len(self.computers)} компьютеров")
-            except:
-                print("Ошибка загрузки данных. Создан новый список.")
-                self.computers = []
+                with open(self.filename, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                self._fill_columns(data)
+                print(f"Загружено {self._ids.size} компьютеров")
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                # Ошибка чтения/разбора не должна стирать коллекцию и
+                # перезаписывать файл тестовыми данными — оставляем как есть
+                print(f"Ошибка загрузки данных: {e}")
         else:
-            self.computers = []
             self.init_sample_data()
-    
-    def save_data(self):
+
+    def save_data(self) -> None:
         """Сохранение данных в файл"""
-        with open(self.filename, 'w', encoding='utf-8') as f:
-            data = [comp.to_dict() for comp in self.computers]
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    
-    def init_sample_data(self):
+        data = [self._row(i).to_dict() for i in range(self._ids.size)]
+        # Пишем во временный файл и атомарно подменяем итоговый, чтобы
+        # падение посреди записи не оставило испорченный JSON
+        tmp = self.filename + '.tmp'
+        if orjson is not None:
+            with open(tmp, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.filename)
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Запись на диск, только если были несохраненные изменения"""
+        if self._dirty:
+            self.save_data()
+
+    def apply_batch(self, ops: List[dict]) -> None:
+        """Пакетное применение операций без вывода в консоль
+
+        Каждая операция — словарь вида {'op': 'add'|'delete'|'upgrade_ram'|'mark_as_sale', ...}.
+        Консольный вывод подавляется, а запись на диск выполняется один раз
+        в конце пакета, поэтому массовые изменения не упираются в печать и I/O.
+        """
+        with contextlib.redirect_stdout(io.StringIO()):
+            for op in ops:
+                kind = op['op']
+                if kind == 'add':
+                    self.add_computer(GamingComputer.from_dict(op['computer']))
+                elif kind == 'delete':
+                    self.delete_by_id(op['id'])
+                elif kind == 'upgrade_ram':
+                    self.upgrade_ram(op['id'], op['ram'])
+                elif kind == 'mark_as_sale':
+                    self.mark_as_sale(op['id'])
+                else:
+                    raise ValueError(f"Неизвестная операция: {kind}")
+        self.flush()
+
+    def init_sample_data(self) -> None:
         """Инициализация тестовыми данными"""
         sample_computers = [
             GamingComputer(1, "GameMaster Pro", "Intel i9-13900K", 32, 1000, "NVIDIA RTX 4090", 250000),
@@ -87,98 +252,129 @@ class ComputerManager:
             GamingComputer(4, "Budget Gamer", "AMD Ryzen 5 7600", 16, 512, "NVIDIA RTX 3060", 90000),
             GamingComputer(5, "Starter Pack", "Intel i5-13400F", 8, 256, "NVIDIA GTX 1660", 55000),
         ]
-        self.computers = sample_computers
+        self._fill_columns([comp.to_dict() for comp in sample_computers])
         self.save_data()
         print("Созданы тестовые данные")
-    
+
     def search_by_criteria(self, min_ram: Optional[int] = None, max_price: Optional[float] = None,
-                           min_ssd: Optional[int] = None, graphics_required: Optional[str] = None):
-        """Поиск компьютеров по нескольким условиям"""
-        results = self.computers
-        
-        if min_ram is not None:
-            results = [c for c in results if c.ram >= min_ram]
-        if max_price is not None:
-            results = [c for c in results if c.price <= max_price]
-        if min_ssd is not None:
-            results = [c for c in results if c.ssd >= min_ssd]
+                           min_ssd: Optional[int] = None,
+                           graphics_required: Optional[str] = None) -> List[GamingComputer]:
+        """Поиск компьютеров по нескольким условиям (булевы маски по колонкам)
+
+        Запрос только по максимальной цене разрешается бинарным поиском
+        по отсортированной перестановке цен вместо полного прохода.
+        """
+        if max_price is not None and min_ram is None and min_ssd is None and not graphics_required:
+            order, sorted_prices = self._price_index()
+            hi = np.searchsorted(sorted_prices, max_price, side='right')
+            return [self._row(i) for i in np.sort(order[:hi])]
+
+        mask = _mask_computers(
+            self._ram, self._price, self._ssd,
+            min_ram if min_ram is not None else 0,
+            max_price if max_price is not None else np.inf,
+            min_ssd if min_ssd is not None else 0
+        )
         if graphics_required:
-            results = [c for c in results if graphics_required.lower() in c.graphics_card.lower()]
-        
-        return results
-    
-    def sort_by_price(self, ascending=True):
+            needle = graphics_required.lower()
+            mask &= np.fromiter((needle in g for g in self._graphics_lower),
+                                np.bool_, self._graphics.size)
+
+        return [self._row(i) for i in np.flatnonzero(mask)]
+
+    def sort_by_price(self, ascending: bool = True) -> List[GamingComputer]:
         """Сортировка по цене"""
-        return sorted(self.computers, key=lambda x: x.price, reverse=not ascending)
-    
-    def sort_by_ram_ssd_sum(self, ascending=True):
+        if ascending:
+            order, _ = self._price_index()
+        else:
+            # Стабильная сортировка по -цене сохраняет исходный порядок
+            # равных цен; разворот возрастающей перестановки — нет
+            order = np.argsort(-self._price, kind='stable')
+        return [self._row(i) for i in order]
+
+    def sort_by_ram_ssd_sum(self, ascending: bool = True) -> List[GamingComputer]:
         """Сортировка по сумме ОЗУ + SSD"""
-        return sorted(self.computers, key=lambda x: x.ram + x.ssd, reverse=not ascending)
-    
-    def add_computer(self, computer: GamingComputer):
+        total = self._ram + self._ssd
+        order = np.argsort(total if ascending else -total, kind='stable')
+        return [self._row(i) for i in order]
+
+    def add_computer(self, computer: GamingComputer) -> None:
         """Добавление нового компьютера с проверкой уникальности ID"""
-        if any(c.id == computer.id for c in self.computers):
+        if computer.id in self._id_index:
             raise ValueError(f"Компьютер с ID {computer.id} уже существует")
-        self.computers.append(computer)
-        self.save_data()
+        self._id_index[computer.id] = self._ids.size
+        self._ids = np.append(self._ids, np.int32(computer.id))
+        self._ram = np.append(self._ram, np.int32(computer.ram))
+        self._ssd = np.append(self._ssd, np.int32(computer.ssd))
+        self._price = np.append(self._price, computer.price)
+        self._price_order = None
+        self._is_on_sale = np.append(self._is_on_sale, computer.is_on_sale)
+        self._models = np.append(self._models, computer.model)
+        self._processors = np.append(self._processors, computer.processor)
+        self._graphics = np.append(self._graphics, computer.graphics_card)
+        self._graphics_lower.append(computer.graphics_card.lower())
+        self._dirty = True
         print(f"Компьютер {computer.model} успешно добавлен")
-    
-    def delete_by_id(self, computer_id: int):
+
+    def delete_by_id(self, computer_id: int) -> None:
         """Удаление компьютера по ID"""
-        initial_count = len(self.computers)
-        self.computers = [c for c in self.computers if c.id != computer_id]
-        if len(self.computers) < initial_count:
-            self.save_data()
+        index = self._id_index.get(computer_id)
+        if index is not None:
+            self._delete_rows(index)
+            self._dirty = True
             print(f"Компьютер с ID {computer_id} удален")
         else:
             print(f"Компьютер с ID {computer_id} не найден")
-    
-    def delete_by_index(self, index: int):
+
+    def delete_by_index(self, index: int) -> None:
         """Удаление компьютера по номеру в списке"""
-        if 0 <= index < len(self.computers):
-            removed = self.computers.pop(index)
-            self.save_data()
-            print(f"Компьютер {removed.model} удален")
+        if 0 <= index < self._ids.size:
+            model = self._models[index]
+            self._delete_rows(index)
+            self._dirty = True
+            print(f"Компьютер {model} удален")
         else:
-            print(f"Неверный индекс. Допустимо: 0-{len(self.computers)-1}")
-    
-    def upgrade_ram(self, computer_id: int, additional_ram: int):
+            print(f"Неверный индекс. Допустимо: 0-{self._ids.size-1}")
+
+    def upgrade_ram(self, computer_id: int, additional_ram: int) -> None:
         """Увеличение объёма ОЗУ у компьютера по ID"""
-        computer = next((c for c in self.computers if c.id == computer_id), None)
-        if computer:
-            computer.ram += additional_ram
-            self.save_data()
-            print(f"ОЗУ компьютера ID {computer_id} увеличено до {computer.ram} ГБ")
+        i = self._id_index.get(computer_id)
+        if i is not None:
+            self._ram[i] += additional_ram
+            self._dirty = True
+            print(f"ОЗУ компьютера ID {computer_id} увеличено до {self._ram[i]} ГБ")
         else:
             print(f"Компьютер с ID {computer_id} не найден")
-    
-    def mark_as_sale(self, computer_id: int):
+
+    def mark_as_sale(self, computer_id: int) -> None:
         """Пометить компьютер как 'распродажа' и уменьшить цену на 10%"""
-        computer = next((c for c in self.computers if c.id == computer_id), None)
-        if computer:
-            if not computer.is_on_sale:
-                computer.is_on_sale = True
-                computer.price *= 0.9  # Уменьшаем цену на 10%
-                self.save_data()
-                print(f"Компьютер ID {computer_id} помечен как распродажа. Новая цена: {computer.price:,.2f} руб.")
+        i = self._id_index.get(computer_id)
+        if i is not None:
+            if not self._is_on_sale[i]:
+                self._is_on_sale[i] = True
+                self._price[i] *= 0.9  # Уменьшаем цену на 10%
+                self._price_order = None
+                self._dirty = True
+                print(f"Компьютер ID {computer_id} помечен как распродажа. Новая цена: {self._price[i]:,.2f} руб.")
             else:
                 print(f"Компьютер ID {computer_id} уже на распродаже")
         else:
             print(f"Компьютер с ID {computer_id} не найден")
-    
-    def get_price_extremes(self):
+
+    def get_price_extremes(self) -> Tuple[Optional[GamingComputer], Optional[GamingComputer]]:
         """Получить самый дорогой и самый дешевый компьютер"""
-        if not self.computers:
+        if not self._ids.size:
             return None, None
-        
-        most_expensive = max(self.computers, key=lambda x: x.price)
-        cheapest = min(self.computers, key=lambda x: x.price)
+
+        most_expensive = self._row(int(self._price.argmax()))
+        cheapest = self._row(int(self._price.argmin()))
         return most_expensive, cheapest
-    
-    def filter_by_graphics(self, min_graphics: str):
+
+    def filter_by_graphics(self, min_graphics: str) -> List[GamingComputer]:
         """Вывести компьютеры с видеокартой не слабее указанной"""
         # Простое сравнение по строке (можно усложнить по рейтингу видеокарт)
-        return [c for c in self.computers if min_graphics.lower() in c.graphics_card.lower()]
+        needle = min_graphics.lower()
+        return [self._row(i) for i, g in enumerate(self._graphics_lower) if needle in g]
 
 
 def print_menu():
@@ -227,8 +423,7 @@ def main():
                 
                 if results:
                     print(f"\nНайдено компьютеров: {len(results)}")
-                    for comp in results:
-                        print(comp)
+                    sys.stdout.write(''.join(f"{comp}\n" for comp in results))
                 else:
                     print("Компьютеры не найдены")
             except ValueError as e:
@@ -239,16 +434,14 @@ def main():
             order = input("По возрастанию (1) или убыванию (2)?: ").strip()
             ascending = order == '1'
             sorted_comps = manager.sort_by_price(ascending)
-            for comp in sorted_comps:
-                print(comp)
+            sys.stdout.write(''.join(f"{comp}\n" for comp in sorted_comps))
         
         elif choice == '3':
             print("\n--- СОРТИРОВКА ПО СУММЕ ОЗУ+SSD ---")
             order = input("По возрастанию (1) или убыванию (2)?: ").strip()
             ascending = order == '1'
             sorted_comps = manager.sort_by_ram_ssd_sum(ascending)
-            for comp in sorted_comps:
-                print(comp)
+            sys.stdout.write(''.join(f"{comp}\n" for comp in sorted_comps))
         
         elif choice == '4':
             print("\n--- ДОБАВЛЕНИЕ НОВОГО КОМПЬЮТЕРА ---")
@@ -277,8 +470,9 @@ def main():
         elif choice == '6':
             print("\n--- УДАЛЕНИЕ ПО НОМЕРУ В СПИСКЕ ---")
             print("Текущий список:")
-            for i, comp in enumerate(manager.computers):
-                print(f"{i}. {comp.model} (ID: {comp.id})")
+            write = sys.stdout.write
+            write(''.join(f"{i}. {comp.model} (ID: {comp.id})\n"
+                          for i, comp in enumerate(manager.computers)))
             try:
                 index = int(input("Введите номер в списке: "))
                 manager.delete_by_index(index)
@@ -319,22 +513,20 @@ def main():
             results = manager.filter_by_graphics(graphics)
             if results:
                 print(f"\nНайдено компьютеров: {len(results)}")
-                for comp in results:
-                    print(comp)
+                sys.stdout.write(''.join(f"{comp}\n" for comp in results))
             else:
                 print("Компьютеры не найдены")
         
         elif choice == '11':
             print("\n--- ВСЕ КОМПЬЮТЕРЫ ---")
             if manager.computers:
-                for comp in manager.computers:
-                    print(comp)
+                sys.stdout.write(''.join(f"{comp}\n" for comp in manager.computers))
             else:
                 print("Список компьютеров пуст")
         
         elif choice == '0':
             print("Сохранение данных и выход...")
-            manager.save_data()
+            manager.flush()
             break
         
         else:
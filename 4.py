@@ -1,10 +1,76 @@
+import atexit
+import contextlib
+import io
 import json
 import os
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 from datetime import datetime
 
-@dataclass
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _stats_kernel(ratings, durations, prices, years, is_epic):
+        """Все числовые агрегаты статистики за один проход по колонкам"""
+        sum_rating = 0.0
+        sum_duration = 0.0
+        sum_price = 0.0
+        min_year = years[0]
+        max_year = years[0]
+        epic_count = 0
+        for i in range(years.shape[0]):
+            sum_rating += ratings[i]
+            sum_duration += durations[i]
+            sum_price += prices[i]
+            if years[i] < min_year:
+                min_year = years[i]
+            if years[i] > max_year:
+                max_year = years[i]
+            if is_epic[i]:
+                epic_count += 1
+        return sum_rating, sum_duration, sum_price, min_year, max_year, epic_count
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _bulk_price_bump(years, prices, threshold, factor):
+        """Параллельное повышение цен по годовому порогу (обходит GIL)"""
+        for i in prange(years.shape[0]):
+            if years[i] < threshold:
+                prices[i] *= factor
+
+    # Прогрев компиляции при импорте, чтобы первые вызовы не ждали JIT
+    _stats_kernel(np.zeros(1, np.float64), np.zeros(1, np.int32),
+                  np.zeros(1, np.float64), np.zeros(1, np.int32),
+                  np.zeros(1, np.bool_))
+    _bulk_price_bump(np.zeros(1, np.int32), np.zeros(1, np.float64), 0, 1.0)
+else:
+    def _stats_kernel(ratings, durations, prices, years, is_epic):
+        """Агрегаты статистики через редукции NumPy (запасной вариант без numba)"""
+        return (float(ratings.sum()), float(durations.sum()), float(prices.sum()),
+                int(years.min()), int(years.max()), int(np.count_nonzero(is_epic)))
+
+
+# Готовый шаблон строкового представления: собирается один раз на модуль,
+# __str__ лишь подставляет значения вместо пересборки f-строки по кускам
+_MOVIE_FMT = ("[ID: {id}] {title}{epic}\n"
+              "  Год: {year}, Жанр: {genre}\n"
+              "  Длительность: {duration} мин, Рейтинг: {rating:.1f}\n"
+              "  Цена: {price:,.2f} руб.\n")
+
+
+@dataclass(slots=True)
 class Movie:
     
     id: int
@@ -17,11 +83,11 @@ class Movie:
     is_epic: bool = False  # Флаг "эпик" (длительность > 150 мин)
     
     def __str__(self):
-        epic_mark = " [ЭПИК]" if self.is_epic else ""
-        return (f"[ID: {self.id}] {self.title}{epic_mark}\n"
-                f"  Год: {self.year}, Жанр: {self.genre}\n"
-                f"  Длительность: {self.duration} мин, Рейтинг: {self.rating:.1f}\n"
-                f"  Цена: {self.price:,.2f} руб.\n")
+        return _MOVIE_FMT.format(
+            id=self.id, title=self.title,
+            epic=" [ЭПИК]" if self.is_epic else "",
+            year=self.year, genre=self.genre, duration=self.duration,
+            rating=self.rating, price=self.price)
     
     def to_dict(self):
         """Преобразование в словарь для сохранения в JSON"""
@@ -52,36 +118,137 @@ class Movie:
 
 
 class MovieManager:
-    """Класс для управления коллекцией фильмов"""
-    
+    """Класс для управления коллекцией фильмов
+
+    Коллекция хранится по колонкам (SoA): числовые поля — в массивах NumPy,
+    строковые — в массивах dtype=object. Флаг is_epic лежит в массиве
+    np.bool_ (1 байт на фильм вместо Python-объекта bool), поэтому подсчет
+    и маскирование по нему — векторные операции. Объекты Movie собираются
+    из колонок только при выводе, так что фильтрация/сортировка/статистика
+    работают по плотным массивам без перебора Python-объектов.
+    """
+
     def __init__(self, filename='movies.json'):
         self.filename = filename
-        self.movies: List[Movie] = []
+        self._ids = np.empty(0, np.int32)
+        self._years = np.empty(0, np.int32)
+        self._durations = np.empty(0, np.int32)
+        self._ratings = np.empty(0, np.float64)
+        self._prices = np.empty(0, np.float64)
+        self._is_epic = np.empty(0, np.bool_)
+        self._titles = np.empty(0, object)
+        self._genres = np.empty(0, object)
+        self._genre_lower: List[str] = []
+        self._genre_codes = np.empty(0, np.int16)
+        self._genre_to_code: dict = {}
+        self._genre_names: List[str] = []
+        self._year_order = np.empty(0, np.intp)
+        self._year_sorted = np.empty(0, np.int32)
+        self._dirty = False
         self.load_data()
-    
-    def load_data(self):
+        atexit.register(self.flush)
+
+    @property
+    def movies(self) -> List[Movie]:
+        """Материализация объектов из колонок (используется только для вывода)"""
+        return [self._row(i) for i in range(self._ids.size)]
+
+    def _row(self, i: int) -> Movie:
+        """Сборка объекта Movie из i-й строки колонок"""
+        return Movie(
+            id=int(self._ids[i]),
+            title=self._titles[i],
+            year=int(self._years[i]),
+            genre=self._genres[i],
+            duration=int(self._durations[i]),
+            rating=float(self._ratings[i]),
+            price=float(self._prices[i]),
+            is_epic=bool(self._is_epic[i])
+        )
+
+    def _fill_columns(self, data: List[dict]) -> None:
+        """Массовое заполнение колонок: np.fromiter с известным count
+        пишет сразу в итоговый массив без промежуточных списков"""
+        n = len(data)
+        self._ids = np.fromiter((item['id'] for item in data), np.int32, n)
+        self._years = np.fromiter((item['year'] for item in data), np.int32, n)
+        self._durations = np.fromiter((item['duration'] for item in data), np.int32, n)
+        self._ratings = np.fromiter((item['rating'] for item in data), np.float64, n)
+        self._prices = np.fromiter((item['price'] for item in data), np.float64, n)
+        self._is_epic = np.fromiter((item.get('is_epic', False) for item in data),
+                                    np.bool_, n)
+        self._titles = np.array([item['title'] for item in data], object)
+        self._genres = np.array([item['genre'] for item in data], object)
+        self._genre_lower = [g.lower() for g in self._genres]
+        # Жанры берутся из небольшого словаря, поэтому храним их и как
+        # категориальные коды int16: компактнее строк и сравниваются как числа
+        genre_to_code: dict = {}
+        codes = np.empty(n, np.int16)
+        for i, g in enumerate(self._genre_lower):
+            codes[i] = genre_to_code.setdefault(g, len(genre_to_code))
+        self._genre_codes = codes
+        self._genre_to_code = genre_to_code
+        self._genre_names = list(genre_to_code)
+        # Годы после загрузки не меняются, поэтому отсортированную
+        # перестановку для диапазонных запросов строим сразу
+        self._year_order = np.argsort(self._years, kind='stable')
+        self._year_sorted = self._years[self._year_order]
+
+    def load_data(self) -> None:
         """Загрузка данных из файла"""
         if os.path.exists(self.filename):
             try:
-                with open(self.filename, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.movies = [Movie.from_dict(item) for item in data]
-                print(f"Загружено {len(self.movies)} фильмов")
+                with open(self.filename, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                self._fill_columns(data)
+                print(f"Загружено {self._ids.size} фильмов")
             except Exception as e:
                 print(f"Ошибка загрузки данных: {e}")
-                self.movies = []
                 self.init_sample_data()
         else:
-            self.movies = []
             self.init_sample_data()
-    
-    def save_data(self):
+
+    def save_data(self) -> None:
         """Сохранение данных в файл"""
-        with open(self.filename, 'w', encoding='utf-8') as f:
-            data = [movie.to_dict() for movie in self.movies]
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    
-    def init_sample_data(self):
+        data = [self._row(i).to_dict() for i in range(self._ids.size)]
+        # Пишем во временный файл и атомарно подменяем итоговый, чтобы
+        # падение посреди записи не оставило испорченный JSON
+        tmp = self.filename + '.tmp'
+        if orjson is not None:
+            with open(tmp, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.filename)
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Запись на диск, только если были несохраненные изменения"""
+        if self._dirty:
+            self.save_data()
+
+    def apply_batch(self, ops: List[dict]) -> None:
+        """Пакетное применение операций без вывода в консоль
+
+        Каждая операция — словарь вида {'op': 'increase_price'|'mark_epic', ...}.
+        Консольный вывод подавляется, а запись на диск выполняется один раз
+        в конце пакета, поэтому массовые изменения не упираются в печать и I/O.
+        """
+        with contextlib.redirect_stdout(io.StringIO()):
+            for op in ops:
+                kind = op['op']
+                if kind == 'increase_price':
+                    self.increase_price_for_old_movies(
+                        op.get('year_threshold', 2000), op.get('increase_percent', 20.0))
+                elif kind == 'mark_epic':
+                    self.mark_epic_movies(op.get('duration_threshold', 150))
+                else:
+                    raise ValueError(f"Неизвестная операция: {kind}")
+        self.flush()
+
+    def init_sample_data(self) -> None:
         """Инициализация тестовыми данными"""
         sample_movies = [
             Movie(1, "Побег из Шоушенка", 1994, "драма", 142, 9.3, 350),
@@ -104,111 +271,135 @@ class MovieManager:
         # Автоматически помечаем фильмы с длительностью > 150 минут
         for movie in sample_movies:
             movie.is_epic = movie.duration > 150
-            
-        self.movies = sample_movies
+
+        self._fill_columns([movie.to_dict() for movie in sample_movies])
         self.save_data()
         print("Созданы тестовые данные")
-    
-    def search_by_year_range_and_genre(self, year_from: Optional[int] = None, 
+
+    def search_by_year_range_and_genre(self, year_from: Optional[int] = None,
                                        year_to: Optional[int] = None,
                                        genre: Optional[str] = None) -> List[Movie]:
         """
         Поиск фильмов по диапазону годов выпуска и жанру
+
+        Диапазон годов разрешается двумя бинарными поисками по заранее
+        отсортированной перестановке (O(log N) вместо полного прохода),
+        жанровый фильтр применяется только к найденному срезу.
         """
-        results = self.movies
-        
-        if year_from is not None:
-            results = [m for m in results if m.year >= year_from]
-        
-        if year_to is not None:
-            results = [m for m in results if m.year <= year_to]
-        
+        lo = (np.searchsorted(self._year_sorted, year_from)
+              if year_from is not None else 0)
+        hi = (np.searchsorted(self._year_sorted, year_to, side='right')
+              if year_to is not None else self._year_sorted.size)
+        candidates = np.sort(self._year_order[lo:hi])
+
         if genre:
-            results = [m for m in results if genre.lower() in m.genre.lower()]
-        
-        return results
-    
-    def sort_by_duration(self, ascending=True) -> List[Movie]:
+            needle = genre.lower()
+            candidates = [i for i in candidates if needle in self._genre_lower[i]]
+
+        return [self._row(i) for i in candidates]
+
+    def sort_by_duration(self, ascending: bool = True) -> List[Movie]:
         """Сортировка фильмов по длительности"""
-        return sorted(self.movies, key=lambda x: x.duration, reverse=not ascending)
-    
+        # Для убывания сортируем по -длительности: стабильный argsort
+        # сохраняет исходный порядок равных значений
+        order = np.argsort(self._durations if ascending else -self._durations,
+                           kind='stable')
+        return [self._row(i) for i in order]
+
     def sort_by_rating_desc(self) -> List[Movie]:
         """Сортировка фильмов по рейтингу (по убыванию)"""
-        return sorted(self.movies, key=lambda x: x.rating, reverse=True)
-    
+        order = np.argsort(-self._ratings, kind='stable')
+        return [self._row(i) for i in order]
+
     def calculate_average_duration(self) -> float:
         """Подсчет средней длительности фильмов"""
-        if not self.movies:
+        if not self._ids.size:
             return 0.0
-        total_duration = sum(movie.duration for movie in self.movies)
-        return total_duration / len(self.movies)
-    
+        return float(self._durations.mean())
+
     def get_top_3_by_rating(self) -> List[Movie]:
         """Вывести топ-3 фильма по рейтингу"""
-        sorted_movies = self.sort_by_rating_desc()
-        return sorted_movies[:3]
-    
+        k = min(3, self._ids.size)
+        if not k:
+            return []
+        # Частичное разбиение O(N) вместо полной сортировки O(N log N):
+        # argpartition выделяет k лучших, досортировываем только их
+        top = np.argpartition(-self._ratings, k - 1)[:k]
+        top = top[np.argsort(-self._ratings[top], kind='stable')]
+        return [self._row(i) for i in top]
+
     def increase_price_for_old_movies(self, year_threshold: int = 2000, increase_percent: float = 20.0) -> List[Movie]:
         """
         Увеличить цену фильмов, выпущенных до указанного года
         Возвращает список измененных фильмов
         """
-        affected_movies = []
-        for movie in self.movies:
-            if movie.year < year_threshold:
-                old_price = movie.price
-                movie.price *= (1 + increase_percent / 100)
-                affected_movies.append((movie, old_price, movie.price))
-        
-        if affected_movies:
-            self.save_data()
-            print(f"Увеличена цена для {len(affected_movies)} фильмов (до {year_threshold} года)")
-            for movie, old_price, new_price in affected_movies:
-                print(f"  - {movie.title} ({movie.year}): {old_price:,.0f} → {new_price:,.0f} руб. (+{increase_percent}%)")
+        factor = 1 + increase_percent / 100
+        mask = self._years < year_threshold
+        affected = np.flatnonzero(mask)
+        old_prices = self._prices[affected]
+        if njit is not None:
+            _bulk_price_bump(self._years, self._prices, year_threshold, factor)
+        else:
+            self._prices[mask] *= factor
+
+        if affected.size:
+            self._dirty = True
+            print(f"Увеличена цена для {affected.size} фильмов (до {year_threshold} года)")
+            for i, old_price in zip(affected, old_prices):
+                print(f"  - {self._titles[i]} ({self._years[i]}): {old_price:,.0f} → {self._prices[i]:,.0f} руб. (+{increase_percent}%)")
         else:
             print(f"Нет фильмов, выпущенных до {year_threshold} года")
-        
-        return [m[0] for m in affected_movies]
-    
+
+        return [self._row(i) for i in affected]
+
     def mark_epic_movies(self, duration_threshold: int = 150) -> List[Movie]:
         """
         Пометить фильмы длительностью более указанной как «эпик»
         Возвращает список помеченных фильмов
         """
-        marked_movies = []
-        for movie in self.movies:
-            if movie.duration > duration_threshold and not movie.is_epic:
-                movie.is_epic = True
-                marked_movies.append(movie)
-        
-        if marked_movies:
-            self.save_data()
-            print(f"Помечено как «эпик»: {len(marked_movies)} фильмов")
-            for movie in marked_movies:
-                print(f"  - {movie.title} ({movie.duration} мин)")
+        mask = (self._durations > duration_threshold) & ~self._is_epic
+        marked = np.flatnonzero(mask)
+        self._is_epic[mask] = True
+
+        if marked.size:
+            self._dirty = True
+            print(f"Помечено как «эпик»: {marked.size} фильмов")
+            for i in marked:
+                print(f"  - {self._titles[i]} ({self._durations[i]} мин)")
         else:
             print("Нет новых фильмов для пометки «эпик»")
-        
-        return marked_movies
-    
+
+        return [self._row(i) for i in marked]
+
     def get_movies_by_genre(self, genre: str) -> List[Movie]:
-        """Получить фильмы по жанру"""
-        return [m for m in self.movies if genre.lower() in m.genre.lower()]
-    
+        """Получить фильмы по жанру (подстрочное совпадение, как в поиске)"""
+        needle = genre.lower()
+        # Сопоставляем только уникальные имена жанров (их единицы),
+        # затем одним np.isin отбираем строки по кодам int16
+        codes = [c for c, name in enumerate(self._genre_names) if needle in name]
+        if not codes:
+            return []
+        indices = np.flatnonzero(np.isin(self._genre_codes, codes))
+        return [self._row(i) for i in indices]
+
     def get_statistics(self) -> dict:
         """Получить статистику по коллекции"""
-        if not self.movies:
+        n = self._ids.size
+        if not n:
             return {}
-        
+
+        sum_rating, sum_duration, sum_price, min_year, max_year, epic_count = _stats_kernel(
+            self._ratings, self._durations, self._prices, self._years, self._is_epic)
+
         stats = {
-            'total_movies': len(self.movies),
-            'average_rating': sum(m.rating for m in self.movies) / len(self.movies),
-            'average_duration': self.calculate_average_duration(),
-            'total_value': sum(m.price for m in self.movies),
-            'oldest_year': min(m.year for m in self.movies),
-            'newest_year': max(m.year for m in self.movies),
-            'epic_count': sum(1 for m in self.movies if m.is_epic),
-            'genres': len(set(m.genre for m in self.movies))
+            'total_movies': int(n),
+            'average_rating': sum_rating / n,
+            'average_duration': sum_duration / n,
+            'total_value': sum_price,
+            'oldest_year': int(min_year),
+            'newest_year': int(max_year),
+            'epic_count': int(epic_count),
+            'genres': len(set(self._genres))
         }
         return stats
 
@@ -254,8 +445,7 @@ def main():
                 
                 if results:
                     print(f"\nНайдено фильмов: {len(results)}")
-                    for movie in results:
-                        print(movie)
+                    sys.stdout.write(''.join(f"{movie}\n" for movie in results))
                 else:
                     print("Фильмы не найдены")
             except ValueError as e:
@@ -266,14 +456,14 @@ def main():
             order = input("По возрастанию (1) или убыванию (2)?: ").strip()
             ascending = order == '1'
             sorted_movies = manager.sort_by_duration(ascending)
-            for movie in sorted_movies:
-                print(movie)
+            sys.stdout.write(''.join(f"{movie}\n" for movie in sorted_movies))
         
         elif choice == '3':
             print("\n--- СОРТИРОВКА ПО РЕЙТИНГУ (ПО УБЫВАНИЮ) ---")
             sorted_movies = manager.sort_by_rating_desc()
-            for i, movie in enumerate(sorted_movies, 1):
-                print(f"{i}. {movie.title} - Рейтинг: {movie.rating:.1f}")
+            write = sys.stdout.write
+            write(''.join(f"{i}. {movie.title} - Рейтинг: {movie.rating:.1f}\n"
+                          for i, movie in enumerate(sorted_movies, 1)))
         
         elif choice == '4':
             print("\n--- СРЕДНЯЯ ДЛИТЕЛЬНОСТЬ ФИЛЬМОВ ---")
@@ -337,7 +527,7 @@ def main():
         
         elif choice == '0':
             print("Сохранение данных и выход...")
-            manager.save_data()
+            manager.flush()
             break
         
         else:
@@ -1,11 +1,27 @@
 import json
 import os
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
 from typing import List, Optional, Tuple
 
+import numpy as np
 
-class Condition(Enum)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@lru_cache(maxsize=128)
+def _norm(s: str) -> str:
+    """Нормализация строки запроса; повторные запросы берутся из кэша"""
+    return s.lower()
+
+
+class Condition(Enum):
     NEW = "новый"
     GOOD = "хороший"
     WORN = "изношенный"
@@ -14,7 +30,12 @@ class Condition(Enum)
     def __str__(self):
         return self.value
 
-@dataclass
+
+# Быстрый поиск состояния по строковому значению вместо перебора Enum
+_CONDITION_BY_VALUE = {c.value: c for c in Condition}
+
+
+@dataclass(slots=True)
 class SportsEquipment:
     """Класс, представляющий сущность Спортивный инвентарь"""
     id: int
@@ -24,62 +45,96 @@ class SportsEquipment:
     price: float     # Цена за единицу
     quantity: int    # Количество на складе
     condition: Condition  # Состояние
+    # Кэшируемые поля не участвуют в __init__/__repr__/сравнении,
+    # но объявлены здесь, чтобы попасть в __slots__
+    _sport_lower: str = field(init=False, repr=False, compare=False)
+    _name_lower: str = field(init=False, repr=False, compare=False)
+    # Отрендеренный __str__; сбрасывается при изменении объекта
+    _str_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Кэшируем строки в нижнем регистре, чтобы не вызывать .lower()
+        # на каждом элементе при каждом поиске
+        self._sport_lower = self.sport_type.lower()
+        self._name_lower = self.name.lower()
     
     def __str__(self):
-        return (f"[ID: {self.id}] {self.name}\n"
+        if self._str_cache is None:
+            self._str_cache = (
+                f"[ID: {self.id}] {self.name}\n"
                 f"  Вид спорта: {self.sport_type}, Вес: {self.weight} кг\n"
                 f"  Цена: {self.price:,.2f} руб., Кол-во: {self.quantity} шт.\n"
                 f"  Состояние: {self.condition}\n")
+        return self._str_cache
     
     def total_value(self) -> float:
         """Общая стоимость данного инвентаря на складе"""
         return self.price * self.quantity
     
-    def to_dict(self):
-        """Преобразование в словарь для сохранения в JSON"""
-        return {
-            'id': self.id,
-            'name': self.name,
-            'sport_type': self.sport_type,
-            'weight': self.weight,
-            'price': self.price,
-            'quantity': self.quantity,
-            'condition': self.condition.value
-        }
-    
-    @classmethod
-    def from_dict(cls, data):
-        """Создание объекта из словаря"""
-        # Преобразуем строку состояния обратно в Enum
-        condition_value = data['condition']
-        condition = next((c for c in Condition if c.value == condition_value), Condition.GOOD)
-        
-        return cls(
-            id=data['id'],
-            name=data['name'],
-            sport_type=data['sport_type'],
-            weight=data['weight'],
-            price=data['price'],
-            quantity=data['quantity'],
-            condition=condition
-        )
+
+# Поля, сериализуемые как есть; condition обрабатывается отдельно
+_EQUIPMENT_FIELDS = ('id', 'name', 'sport_type', 'weight', 'price', 'quantity')
+
+
+def _build_serializers():
+    """Сгенерировать специализированные to_dict/from_dict:
+    все обращения к полям развёрнуты в коде, без циклов по полям"""
+    pairs = ', '.join(f"'{f}': self.{f}" for f in _EQUIPMENT_FIELDS)
+    kwargs = ', '.join(f"{f}=data['{f}']" for f in _EQUIPMENT_FIELDS)
+    src = (
+        'def to_dict(self):\n'
+        '    """Преобразование в словарь для сохранения в JSON"""\n'
+        f'    return {{{pairs}, \'condition\': self.condition.value}}\n'
+        'def from_dict(cls, data):\n'
+        '    """Создание объекта из словаря"""\n'
+        f'    return cls({kwargs}, condition=_CONDITION_BY_VALUE.get('
+        'data[\'condition\'], Condition.GOOD))\n'
+    )
+    ns = {'_CONDITION_BY_VALUE': _CONDITION_BY_VALUE, 'Condition': Condition}
+    exec(src, ns)
+    return ns['to_dict'], ns['from_dict']
+
+
+_to_dict, _from_dict = _build_serializers()
+SportsEquipment.to_dict = _to_dict
+SportsEquipment.from_dict = classmethod(_from_dict)
+del _to_dict, _from_dict
 
 
 class InventoryManager:
     """Класс для управления складом спортивного инвентаря"""
     
+    # Состояния, которые не переводятся в «требует ремонта»
+    _MARK_SKIP = frozenset({Condition.NEW, Condition.NEEDS_REPAIR})
+    
     def __init__(self, filename='inventory.json'):
         self.filename = filename
         self.items: List[SportsEquipment] = []
+        # Текущие суммарная стоимость и число единиц на складе,
+        # поддерживаются инкрементально
+        self._total_value: float = 0.0
+        self._total_units: int = 0
+        # Индекс id -> объект для поиска без перебора списка
+        self._by_id: dict = {}
+        # Колонка весов для векторного поиска максимума
+        self._weights = np.empty(0, dtype=np.float64)
+        # Отложенная запись: мутации только помечают данные изменёнными,
+        # на диск пишет flush()
+        self._dirty = False
         self.load_data()
     
     def load_data(self):
         """Загрузка данных из файла"""
         if os.path.exists(self.filename):
             try:
-                with open(self.filename, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.items = [SportsEquipment.from_dict(item) for item in data]
+                with open(self.filename, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                self.items = [SportsEquipment.from_dict(item) for item in data]
+                self._total_value = sum(i.price * i.quantity for i in self.items)
+                self._total_units = sum(i.quantity for i in self.items)
+                self._by_id = {i.id: i for i in self.items}
+                self._reindex()
                 print(f"Загружено {len(self.items)} позиций инвентаря")
             except Exception as e:
                 print(f"Ошибка загрузки данных: {e}")
@@ -91,9 +146,24 @@ class InventoryManager:
     
     def save_data(self):
         """Сохранение данных в файл"""
-        with open(self.filename, 'w', encoding='utf-8') as f:
-            data = [item.to_dict() for item in self.items]
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        data = [item.to_dict() for item in self.items]
+        if orjson is not None:
+            with open(self.filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(self.filename, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        self._dirty = False
+    
+    def flush(self):
+        """Записать накопленные изменения на диск, если они есть"""
+        if self._dirty:
+            self.save_data()
+    
+    def _reindex(self):
+        """Перестроить колонку весов после изменения порядка элементов"""
+        self._weights = np.fromiter((i.weight for i in self.items),
+                                    dtype=np.float64, count=len(self.items))
     
     def init_sample_data(self):
         """Инициализация тестовыми данными"""
@@ -110,6 +180,10 @@ class InventoryManager:
             SportsEquipment(10, "Лыжи", "лыжный спорт", 2.5, 18000, 8, Condition.NEEDS_REPAIR),
         ]
         self.items = sample_items
+        self._total_value = sum(i.price * i.quantity for i in self.items)
+        self._total_units = sum(i.quantity for i in self.items)
+        self._by_id = {i.id: i for i in self.items}
+        self._reindex()
         self.save_data()
         print("Созданы тестовые данные")
     
@@ -119,33 +193,36 @@ class InventoryManager:
         """
         Поиск инвентаря по виду спорта и диапазону веса
         """
-        results = self.items
-        
-        if sport_type:
-            results = [item for item in results if sport_type.lower() in item.sport_type.lower()]
-        
-        if min_weight is not None:
-            results = [item for item in results if item.weight >= min_weight]
-        
-        if max_weight is not None:
-            results = [item for item in results if item.weight <= max_weight]
+        # Один проход по списку: сначала дешёвые сравнения веса,
+        # затем поиск подстроки
+        sport_lower = _norm(sport_type) if sport_type else None
+        wmin = min_weight if min_weight is not None else float('-inf')
+        wmax = max_weight if max_weight is not None else float('inf')
         
-        return results
+        return [item for item in self.items
+                if wmin <= item.weight <= wmax
+                and (sport_lower is None or sport_lower in item._sport_lower)]
     
     def sort_by_price(self, ascending=True) -> List[SportsEquipment]:
         """Сортировка по цене"""
-        return sorted(self.items, key=lambda x: x.price, reverse=not ascending)
+        # Сортируем на месте: результат только выводится на экран,
+        # отдельная копия списка не нужна
+        self.items.sort(key=attrgetter('price'), reverse=not ascending)
+        self._reindex()
+        return self.items
     
     def sort_by_quantity_desc(self) -> List[SportsEquipment]:
         """Сортировка по количеству на складе (по убыванию)"""
-        return sorted(self.items, key=lambda x: x.quantity, reverse=True)
+        self.items.sort(key=attrgetter('quantity'), reverse=True)
+        self._reindex()
+        return self.items
     
     def write_off(self, item_id: int, quantity: int) -> bool:
         """
         Списать инвентарь - уменьшить количество на складе
         Возвращает True, если операция успешна
         """
-        item = next((i for i in self.items if i.id == item_id), None)
+        item = self._by_id.get(item_id)
         if not item:
             print(f"Инвентарь с ID {item_id} не найден")
             return False
@@ -159,7 +236,10 @@ class InventoryManager:
             return False
         
         item.quantity -= quantity
-        self.save_data()
+        item._str_cache = None
+        self._total_value -= item.price * quantity
+        self._total_units -= quantity
+        self._dirty = True
         print(f"Списано {quantity} ед. инвентаря '{item.name}'. Остаток: {item.quantity}")
         
         # Автоматическое удаление, если количество стало 0
@@ -170,8 +250,12 @@ class InventoryManager:
     
     def calculate_total_warehouse_value(self) -> float:
         """Подсчитать общую стоимость склада"""
-        total = sum(item.total_value() for item in self.items)
-        return total
+        # Сумма поддерживается при изменениях, пересчёт не нужен
+        return self._total_value
+    
+    def summary(self) -> Tuple[float, int]:
+        """Общая стоимость склада и число единиц за одно обращение"""
+        return self._total_value, self._total_units
     
     def get_new_items(self) -> List[SportsEquipment]:
         """Вывести инвентарь в состоянии «новый»"""
@@ -184,12 +268,13 @@ class InventoryManager:
         """
         marked_items = []
         for item in self.items:
-            if item.condition != Condition.NEW and item.condition != Condition.NEEDS_REPAIR:
+            if item.condition not in self._MARK_SKIP:
                 item.condition = Condition.NEEDS_REPAIR
+                item._str_cache = None
                 marked_items.append(item)
         
         if marked_items:
-            self.save_data()
+            self._dirty = True
             print(f"Помечено как 'требует ремонта': {len(marked_items)} позиций")
         else:
             print("Нет инвентаря для пометки на ремонт")
@@ -200,7 +285,7 @@ class InventoryManager:
         """Найти самый тяжёлый инвентарь"""
         if not self.items:
             return None
-        return max(self.items, key=lambda x: x.weight)
+        return self.items[int(self._weights.argmax())]
     
     def delete_zero_quantity(self) -> int:
         """
@@ -210,9 +295,12 @@ class InventoryManager:
         initial_count = len(self.items)
         self.items = [item for item in self.items if item.quantity > 0]
         deleted_count = initial_count - len(self.items)
+        if deleted_count > 0:
+            self._by_id = {i.id: i for i in self.items}
+            self._reindex()
         
         if deleted_count > 0:
-            self.save_data()
+            self._dirty = True
             print(f"Удалено {deleted_count} позиций с нулевым количеством")
         else:
             print("Нет позиций с нулевым количеством")
@@ -220,6 +308,25 @@ class InventoryManager:
         return deleted_count
 
 
+_INTERACTIVE = sys.stdin.isatty()
+
+
+def _ask(prompt):
+    """Прочитать строку из stdin; подсказка выводится только в терминале"""
+    if _INTERACTIVE:
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
+
+
+def _print_items(items):
+    """Вывести список позиций одной записью в stdout вместо print на элемент"""
+    sys.stdout.write('\n'.join(str(item) for item in items) + '\n')
+
+
 def print_menu():
     """Вывод меню"""
     print("\n" + "="*60)
@@ -244,26 +351,25 @@ def main():
     
     while True:
         print_menu()
-        choice = input("Выберите действие: ").strip()
+        choice = _ask("Выберите действие: ").strip()
         
         if choice == '1':
             print("\n--- ПОИСК ПО ВИДУ СПОРТА И ДИАПАЗОНУ ВЕСА ---")
             try:
-                sport = input("Вид спорта (Enter - пропустить): ").strip()
+                sport = _ask("Вид спорта (Enter - пропустить): ").strip()
                 sport = sport if sport else None
                 
-                min_weight = input("Минимальный вес (кг, Enter - пропустить): ").strip()
+                min_weight = _ask("Минимальный вес (кг, Enter - пропустить): ").strip()
                 min_weight = float(min_weight) if min_weight else None
                 
-                max_weight = input("Максимальный вес (кг, Enter - пропустить): ").strip()
+                max_weight = _ask("Максимальный вес (кг, Enter - пропустить): ").strip()
                 max_weight = float(max_weight) if max_weight else None
                 
                 results = manager.search_by_sport_and_weight(sport, min_weight, max_weight)
                 
                 if results:
                     print(f"\nНайдено позиций: {len(results)}")
-                    for item in results:
-                        print(item)
+                    _print_items(results)
                 else:
                     print("Инвентарь не найден")
             except ValueError as e:
@@ -271,17 +377,15 @@ def main():
         
         elif choice == '2':
             print("\n--- СОРТИРОВКА ПО ЦЕНЕ ---")
-            order = input("По возрастанию (1) или убыванию (2)?: ").strip()
+            order = _ask("По возрастанию (1) или убыванию (2)?: ").strip()
             ascending = order == '1'
             sorted_items = manager.sort_by_price(ascending)
-            for item in sorted_items:
-                print(item)
+            _print_items(sorted_items)
         
         elif choice == '3':
             print("\n--- СОРТИРОВКА ПО КОЛИЧЕСТВУ (ПО УБЫВАНИЮ) ---")
             sorted_items = manager.sort_by_quantity_desc()
-            for item in sorted_items:
-                print(item)
+            _print_items(sorted_items)
         
         elif choice == '4':
             print("\n--- СПИСАНИЕ ИНВЕНТАРЯ ---")
@@ -291,27 +395,23 @@ def main():
                 for item in manager.items:
                     print(f"ID: {item.id} - {item.name} (в наличии: {item.quantity})")
                 
-                item_id = int(input("\nID инвентаря для списания: "))
-                quantity = int(input("Количество для списания: "))
+                item_id = int(_ask("\nID инвентаря для списания: "))
+                quantity = int(_ask("Количество для списания: "))
                 manager.write_off(item_id, quantity)
             except ValueError:
                 print("Неверный формат числа")
         
         elif choice == '5':
             print("\n--- ОБЩАЯ СТОИМОСТЬ СКЛАДА ---")
-            total = manager.calculate_total_warehouse_value()
+            total, total_items = manager.summary()
             print(f"Общая стоимость всех товаров на складе: {total:,.2f} руб.")
-            
-        
-            total_items = sum(item.quantity for item in manager.items)
             print(f"Всего единиц инвентаря: {total_items} шт.")
         
         elif choice == '6':
             print("\n--- ИНВЕНТАРЬ В СОСТОЯНИИ «НОВЫЙ» ---")
             new_items = manager.get_new_items()
             if new_items:
-                for item in new_items:
-                    print(item)
+                _print_items(new_items)
             else:
                 print("Нет нового инвентаря")
         
@@ -340,8 +440,7 @@ def main():
         elif choice == '10':
             print("\n--- ВЕСЬ ИНВЕНТАРЬ ---")
             if manager.items:
-                for item in manager.items:
-                    print(item)
+                _print_items(manager.items)
               
                 total_value = manager.calculate_total_warehouse_value()
                 print(f"\nИтого позиций: {len(manager.items)}")
@@ -351,13 +450,15 @@ def main():
         
         elif choice == '0':
             print("Сохранение данных и выход...")
-            manager.save_data()
+            manager.flush()
             break
         
         else:
             print("Неверный выбор. Попробуйте снова.")
         
-        input("\nНажмите Enter для продолжения...")
+        manager.flush()
+        if _INTERACTIVE:
+            _ask("\nНажмите Enter для продолжения...")
 
 
 if __name__ == "__main__":
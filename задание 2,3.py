@@ -1,4 +1,22 @@
+from functools import lru_cache
+from operator import attrgetter
+
+import numpy as np
+
+
+@lru_cache(maxsize=128)
+def _norm(s):
+    """Нормализация строки запроса; повторные запросы берутся из кэша"""
+    return s.lower()
+
+
 class VideoGame:
+    # __slots__ убирает per-object __dict__: меньше памяти и быстрее
+    # доступ к атрибутам в циклах фильтрации/сортировки
+    __slots__ = ('title', 'genre', 'platform', 'age_rating', 'player_score',
+                 'price', 'copies_sold', 'is_hit',
+                 '_title_lower', '_genre_lower', '_platform_lower')
+
     def __init__(self, title, genre, platform, age_rating, player_score, price, copies_sold):
         self.title = title
         self.genre = genre
@@ -7,7 +25,11 @@ class VideoGame:
         self.player_score = player_score
         self.price = price
         self.copies_sold = copies_sold
-        self.is_hit = False  
+        self.is_hit = False
+        # Кэш строк в нижнем регистре для поиска и фильтрации
+        self._title_lower = title.lower()
+        self._genre_lower = genre.lower()
+        self._platform_lower = platform.lower()
 
     def update_hit_status(self):
         self.is_hit = self.player_score >= 8.5
@@ -20,52 +42,97 @@ class VideoGame:
 class GameManager:
     def __init__(self):
         self.games = []
+        # Счётчик изменений и кэш результатов поиска/сортировки:
+        # повторные вызовы с теми же аргументами не пересчитываются
+        self._version = 0
+        self._cache = {}
+        # Текущая сумма цен, чтобы average_price не обходил весь список
+        self._price_sum = 0.0
+        # Ключ (by, ascending), по которому self.games уже отсортирован
+        self._sorted_by = None
+
+    def _invalidate(self):
+        self._version += 1
+        self._cache.clear()
+        self._sorted_by = None
 
     def add_game(self, game):
         self.games.append(game)
         game.update_hit_status()
+        self._price_sum += game.price
+        self._invalidate()
 
     def search_by_title(self, substring):
-        return [game for game in self.games if substring.lower() in game.title.lower()]
+        key = ('search_by_title', substring, self._version)
+        if key in self._cache:
+            return self._cache[key]
+        substring_lower = _norm(substring)
+        result = [game for game in self.games if substring_lower in game._title_lower]
+        self._cache[key] = result
+        return result
 
     def filter_games(self, age_rating=None, platform=None):
+        key = ('filter_games', age_rating, platform, self._version)
+        if key in self._cache:
+            return self._cache[key]
         filtered = self.games
+        if age_rating is None and platform is None:
+            # Копия вместо живого self.games: закэшированный результат
+            # не должен меняться под руками у вызывающего кода
+            filtered = list(filtered)
         if age_rating is not None:
             filtered = [game for game in filtered if game.age_rating == age_rating]
         if platform is not None:
-            filtered = [game for game in filtered if game.platform.lower() == platform.lower()]
+            platform_lower = _norm(platform)
+            filtered = [game for game in filtered if game._platform_lower == platform_lower]
+        self._cache[key] = filtered
         return filtered
 
-    def sort_games(self, by='score', ascending=False)
+    def sort_games(self, by='score', ascending=False):
         if by == 'score':
-            return sorted(self.games, key=lambda g: g.player_score, reverse=not ascending)
+            key = attrgetter('player_score')
         elif by == 'name':
-            return sorted(self.games, key=lambda g: g.title.lower(), reverse=not ascending)
+            key = attrgetter('_title_lower')
         else:
             return self.games
-
-    def change_price_by_genre(self, genre, discount_percent)
+        # Список сортируется на месте один раз на пакет изменений;
+        # повторные вызовы с тем же ключом возвращают копию без сортировки
+        if self._sorted_by != (by, ascending):
+            self.games.sort(key=key, reverse=not ascending)
+            # Порядок self.games изменился: снимки в кэше поиска/фильтров
+            # больше не совпадают с тем, что дал бы свежий проход
+            self._cache.clear()
+            self._sorted_by = (by, ascending)
+        return list(self.games)
+
+    def change_price_by_genre(self, genre, discount_percent):
+        genre_lower = _norm(genre)
         for game in self.games:
-            if game.genre.lower() == genre.lower():
+            if game._genre_lower == genre_lower:
+                old_price = game.price
                 game.price *= (1 - discount_percent / 100)
+                self._price_sum += game.price - old_price
+        self._invalidate()
 
     def average_price(self):
         if not self.games:
             return 0.0
-        total = sum(game.price for game in self.games)
-        return total / len(self.games)
+        return self._price_sum / len(self.games)
 
     def game_with_max_score(self):
         if not self.games:
             return None
-        return max(self.games, key=lambda g: g.player_score)
+        return max(self.games, key=attrgetter('player_score'))
 
     def mark_hits(self):
         for game in self.games:
             game.update_hit_status()
+        self._invalidate()
 
     def remove_out_of_stock(self):
         self.games = [game for game in self.games if game.copies_sold > 0]
+        self._price_sum = sum(game.price for game in self.games)
+        self._invalidate()
 
     def print_games(self, games_list=None):
         if games_list is None:
@@ -134,9 +201,13 @@ if __name__ == "__main__":
 
 
 
-ЗАДАНИЕ 3
+# ЗАДАНИЕ 3
 
 class OnlineCourse:
+    __slots__ = ('title', 'platform', 'difficulty', 'duration_hours',
+                 'rating', 'price', 'students_enrolled',
+                 '_platform_lower', '_difficulty_lower')
+
     def __init__(self, title, platform, difficulty, duration_hours, rating, price, students_enrolled):
         self.title = title
         self.platform = platform
@@ -145,6 +216,9 @@ class OnlineCourse:
         self.rating = rating
         self.price = price
         self.students_enrolled = students_enrolled
+        # Кэш строк в нижнем регистре для поиска и фильтрации
+        self._platform_lower = platform.lower()
+        self._difficulty_lower = difficulty.lower()
 
     def __str__(self):
         return (f"{self.title} [{self.platform}] | "
@@ -158,62 +232,103 @@ class OnlineCourse:
 class CourseManager:
     def __init__(self):
         self.courses = []
+        # Тот же приём, что и в GameManager: кэш, сбрасываемый при изменениях
+        self._version = 0
+        self._cache = {}
+
+    def _invalidate(self):
+        self._version += 1
+        self._cache.clear()
 
     def add_course(self, course):
         self.courses.append(course)
-      
+        self._invalidate()
+
     def search_by_platform_and_difficulty(self, platform=None, difficulty=None):
         """Поиск курсов по платформе и/или уровню сложности"""
+        key = ('search_by_platform_and_difficulty', platform, difficulty, self._version)
+        if key in self._cache:
+            return self._cache[key]
         result = self.courses
         if platform:
-            result = [c for c in result if c.platform.lower() == platform.lower()]
+            platform_lower = _norm(platform)
+            result = [c for c in result if c._platform_lower == platform_lower]
         if difficulty:
-            result = [c for c in result if c.difficulty.lower() == difficulty.lower()]
+            difficulty_lower = _norm(difficulty)
+            result = [c for c in result if c._difficulty_lower == difficulty_lower]
+        self._cache[key] = result
         return result
 
     def sort_courses(self, by='duration', ascending=True):
         """Сортировка по длительности или количеству студентов"""
+        key = ('sort_courses', by, ascending, self._version)
+        if key in self._cache:
+            return self._cache[key]
         if by == 'duration':
-            return sorted(self.courses, 
-                         key=lambda c: c.duration_hours, 
-                         reverse=not ascending)
+            result = sorted(self.courses, 
+                            key=attrgetter('duration_hours'), 
+                            reverse=not ascending)
         elif by == 'students':
-            return sorted(self.courses, 
-                         key=lambda c: c.students_enrolled, 
-                         reverse=not ascending)
+            result = sorted(self.courses, 
+                            key=attrgetter('students_enrolled'), 
+                            reverse=not ascending)
         else:
-            return self.courses
+            result = self.courses
+        self._cache[key] = result
+        return result
 
     def total_revenue(self):
         """Общий доход от всех курсов"""
-        return sum(course.price * course.students_enrolled for course in self.courses)
+        key = ('total_revenue', self._version)
+        if key in self._cache:
+            return self._cache[key]
+        n = len(self.courses)
+        prices = np.fromiter((c.price for c in self.courses),
+                             dtype=np.float64, count=n)
+        students = np.fromiter((c.students_enrolled for c in self.courses),
+                               dtype=np.float64, count=n)
+        result = float(prices @ students)
+        self._cache[key] = result
+        return result
 
     def increase_price_for_advanced(self, percent=15):
         """Увеличить цену продвинутых курсов на указанный процент"""
         for course in self.courses:
-            if course.difficulty.lower() == "продвинутый":
+            if course._difficulty_lower == "продвинутый":
                 course.price *= (1 + percent / 100)
+        self._invalidate()
 
     def courses_longer_than(self, hours):
         """Курсы длительностью больше указанного количества часов"""
-        return [course for course in self.courses if course.duration_hours > hours]
+        key = ('courses_longer_than', hours, self._version)
+        if key in self._cache:
+            return self._cache[key]
+        result = [course for course in self.courses if course.duration_hours > hours]
+        self._cache[key] = result
+        return result
 
     def course_with_min_rating(self):
         """Курс с минимальным рейтингом"""
         if not self.courses:
             return None
-        return min(self.courses, key=lambda c: c.rating)
+        return min(self.courses, key=attrgetter('rating'))
 
     def merge_platforms(self, platform1, platform2):
         """Объединить курсы двух платформ"""
-        platform1_lower = platform1.lower()
-        platform2_lower = platform2.lower()
-        return [course for course in self.courses 
-                if course.platform.lower() in [platform1_lower, platform2_lower]]
+        key = ('merge_platforms', platform1, platform2, self._version)
+        if key in self._cache:
+            return self._cache[key]
+        platform1_lower = _norm(platform1)
+        platform2_lower = _norm(platform2)
+        result = [course for course in self.courses 
+                  if course._platform_lower in (platform1_lower, platform2_lower)]
+        self._cache[key] = result
+        return result
 
     def remove_low_rating_courses(self, threshold=4.0):
         """Удалить курсы с рейтингом ниже указанного порога"""
         self.courses = [course for course in self.courses if course.rating >= threshold]
+        self._invalidate()
 
     def print_courses(self, courses_list=None):
         """Вспомогательный метод для вывода списка курсов"""